@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 
@@ -48,6 +49,53 @@ MILEAGE_SCALE = {
     ],
 }
 
+
+@dataclass(frozen=True)
+class MileageScaleTable:
+    """Column-oriented view of the mileage brackets of a fiscal power.
+
+    Attributes:
+        max_km: Inclusive maximum km per bracket, sorted ascending. The last
+            bracket has no limit and always uses infinity.
+        rates: Rate applied to kilometers for each bracket.
+        fixed: Fixed amount added for each bracket.
+    """
+
+    max_km: tuple[float, ...]
+    rates: tuple[float, ...]
+    fixed: tuple[float, ...]
+
+
+def build_scale_table(brackets: list[MileageBracket]) -> MileageScaleTable:
+    """Build the column-oriented table for a list of brackets.
+
+    Args:
+        brackets: Brackets sorted by increasing max_km.
+
+    Returns:
+        MileageScaleTable: Parallel tuples of thresholds, rates and fixed.
+
+    Raises:
+        ValueError: If the last bracket has a kilometer limit.
+    """
+
+    if not brackets or brackets[-1].max_km is not None:
+        raise ValueError("The last mileage bracket must have no limit")
+    return MileageScaleTable(
+        max_km=tuple(
+            math.inf if bracket.max_km is None else float(bracket.max_km)
+            for bracket in brackets
+        ),
+        rates=tuple(bracket.rate for bracket in brackets),
+        fixed=tuple(bracket.fixed for bracket in brackets),
+    )
+
+
+MILEAGE_SCALE_TABLES = {
+    power_cv: build_scale_table(brackets)
+    for power_cv, brackets in MILEAGE_SCALE.items()
+}
+
 MAX_CV = 7
 
 MEAL_MINIMUM_COST = 5.20
@@ -2,15 +2,99 @@
 
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 DB_PATH = Path("data.db")
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+READER_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA busy_timeout=5000",
+)
+READER_POOL_SIZE = os.cpu_count() or 4
+STATEMENT_CACHE_SIZE = 256
+INSERT_BATCH_SIZE = 50
+READ_STATEMENTS = ("SELECT", "WITH")
+
+_CONNECTION: sqlite3.Connection | None = None
+_CONNECTION_LOCK = threading.Lock()
+_WRITE_LOCK = threading.Lock()
+_READERS: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+_READER_COUNT = 0
+_READER_LOCK = threading.Lock()
+_DATA_VERSION = 0
+DataVersion = tuple[int, int]
+_AGGREGATES: dict[str, type[Any]] = {}
+_DATA_VERSION_LOCK = threading.Lock()
+
+
+def register_aggregate(name: str, aggregate: type[Any]) -> None:
+    """Make a single-argument Python aggregate callable from SQL.
+
+    Aggregates are attached to every connection opened afterwards, so they
+    must be registered before init_db opens the connections.
+
+    Args:
+        name: SQL name of the aggregate.
+        aggregate: Class with step and finalize methods.
+    """
+
+    _AGGREGATES[name] = aggregate
+
+
+def attach_aggregates(connection: sqlite3.Connection) -> None:
+    """Attach every registered aggregate to a connection.
+
+    Args:
+        connection: Newly opened connection.
+
+    Raises:
+        sqlite3.Error: If an aggregate cannot be attached.
+    """
+
+    for name, aggregate in _AGGREGATES.items():
+        connection.create_aggregate(name, 1, aggregate)
+
+
+def open_connection() -> sqlite3.Connection:
+    """Open a new tuned SQLite connection.
+
+    Returns:
+        sqlite3.Connection: New SQLite connection.
+
+    Raises:
+        sqlite3.Error: If the connection cannot be created.
+    """
+
+    connection = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    connection.row_factory = sqlite3.Row
+    attach_aggregates(connection)
+    for pragma in CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+    return connection
 
 
 def get_connection() -> sqlite3.Connection:
-    """Create and return a SQLite connection.
+    """Return the shared SQLite connection, opening it on first use.
 
     Returns:
         sqlite3.Connection: Active SQLite connection.
@@ -19,14 +103,152 @@ def get_connection() -> sqlite3.Connection:
         sqlite3.Error: If the connection cannot be created.
     """
 
-    connection = sqlite3.connect(DB_PATH)
+    global _CONNECTION
+    if _CONNECTION is None:
+        with _CONNECTION_LOCK:
+            if _CONNECTION is None:
+                _CONNECTION = open_connection()
+    return _CONNECTION
+
+
+def close_connection() -> None:
+    """Close the shared SQLite connection if it is open.
+
+    Raises:
+        sqlite3.Error: If the connection cannot be closed.
+    """
+
+    global _CONNECTION
+    with _CONNECTION_LOCK:
+        if _CONNECTION is not None:
+            _CONNECTION.close()
+            _CONNECTION = None
+
+
+def open_reader() -> sqlite3.Connection:
+    """Open a new read-only SQLite connection.
+
+    Returns:
+        sqlite3.Connection: New read-only connection.
+
+    Raises:
+        sqlite3.Error: If the connection cannot be created.
+    """
+
+    uri = f"{DB_PATH.resolve().as_uri()}?mode=ro"
+    connection = sqlite3.connect(
+        uri,
+        uri=True,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     connection.row_factory = sqlite3.Row
+    attach_aggregates(connection)
+    for pragma in READER_PRAGMAS:
+        connection.execute(pragma)
     return connection
 
 
+def acquire_reader() -> sqlite3.Connection:
+    """Take a reader from the pool, opening one while below the pool size.
+
+    Returns:
+        sqlite3.Connection: Read-only connection.
+
+    Raises:
+        sqlite3.Error: If a new connection cannot be created.
+    """
+
+    global _READER_COUNT
+    try:
+        return _READERS.get_nowait()
+    except queue.Empty:
+        pass
+    with _READER_LOCK:
+        if _READER_COUNT < READER_POOL_SIZE:
+            _READER_COUNT += 1
+            try:
+                return open_reader()
+            except sqlite3.Error:
+                _READER_COUNT -= 1
+                raise
+    return _READERS.get()
+
+
+@contextmanager
+def borrow_reader() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled read-only connection for the duration of a block.
+
+    Under WAL, pooled readers query concurrently with each other and with
+    the shared writer connection.
+
+    Yields:
+        sqlite3.Connection: Read-only connection.
+
+    Raises:
+        sqlite3.Error: If a new connection cannot be created.
+    """
+
+    connection = acquire_reader()
+    try:
+        yield connection
+    finally:
+        _READERS.put(connection)
+
+
+def close_readers() -> None:
+    """Close every idle pooled reader.
+
+    Raises:
+        sqlite3.Error: If a connection cannot be closed.
+    """
+
+    global _READER_COUNT
+    with _READER_LOCK:
+        while True:
+            try:
+                connection = _READERS.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+            _READER_COUNT -= 1
+
+
+def get_data_version() -> DataVersion:
+    """Return the version of the stored data.
+
+    The version changes after every committed write, so values computed
+    from the database can be cached alongside the version they were
+    computed at. It pairs the count of writes committed by this process
+    with the shared connection's PRAGMA data_version, which changes when
+    another connection commits, such as another worker process.
+
+    Returns:
+        DataVersion: Current data version.
+
+    Raises:
+        sqlite3.Error: If the connection cannot be created.
+    """
+
+    local_version = _DATA_VERSION
+    row = get_connection().execute("PRAGMA data_version").fetchone()
+    return local_version, row[0]
+
+
+def bump_data_version() -> None:
+    """Mark the stored data as changed."""
+
+    global _DATA_VERSION
+    with _DATA_VERSION_LOCK:
+        _DATA_VERSION += 1
+
+
 def execute_script(connection: sqlite3.Connection, script: str) -> None:
     """Execute a SQL script using the provided connection.
 
+    The script runs under the write lock, like every other write on the
+    shared connection.
+
     Args:
         connection: Active database connection.
         script: SQL script to execute.
@@ -35,12 +257,16 @@ def execute_script(connection: sqlite3.Connection, script: str) -> None:
         sqlite3.Error: If the script execution fails.
     """
 
-    connection.executescript(script)
-    connection.commit()
+    with write_transaction(connection):
+        connection.executescript(script)
+    bump_data_version()
 
 
 def init_db() -> None:
-    """Initialize database tables if they do not exist.
+    """Initialize database tables and indexes if they do not exist.
+
+    The shared connection and the reader pool are reopened so that they
+    target the current database file.
 
     Raises:
         sqlite3.Error: If table creation fails.
@@ -97,9 +323,52 @@ def init_db() -> None:
         attachment_path TEXT,
         FOREIGN KEY (person_id) REFERENCES persons(id)
     );
+
+    CREATE INDEX IF NOT EXISTS idx_persons_household
+        ON persons(household_id);
+    CREATE INDEX IF NOT EXISTS idx_vehicles_person
+        ON vehicles(person_id);
+    DROP INDEX IF EXISTS idx_mileage_person_year;
+    DROP INDEX IF EXISTS idx_meal_person_year;
+    DROP INDEX IF EXISTS idx_other_person_year;
+    CREATE INDEX IF NOT EXISTS idx_mileage_year_covering
+        ON mileage_entries(year, person_id, vehicle_id, km);
+    CREATE INDEX IF NOT EXISTS idx_meal_year_covering
+        ON meal_expenses(year, person_id, meal_cost);
+    CREATE INDEX IF NOT EXISTS idx_other_year_covering
+        ON other_expenses(year, person_id, amount);
     """
-    with get_connection() as connection:
-        execute_script(connection, schema)
+    close_readers()
+    close_connection()
+    connection = get_connection()
+    execute_script(connection, schema)
+
+
+@contextmanager
+def write_transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    """Serialize a write on the shared connection and commit it.
+
+    The write is committed and the data version bumped when the block
+    exits; a block that raises anything is rolled back before the lock is
+    released so it cannot leak into another request.
+
+    Args:
+        connection: Shared writer connection.
+
+    Raises:
+        sqlite3.Error: If the write or the commit fails.
+    """
+
+    with _WRITE_LOCK:
+        try:
+            yield
+        except BaseException:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+        if connection.in_transaction:
+            connection.commit()
+            bump_data_version()
 
 
 def execute_query(
@@ -109,6 +378,9 @@ def execute_query(
 ) -> sqlite3.Cursor:
     """Execute a parameterized SQL query.
 
+    Read statements run without locking and do not open a transaction.
+    Write statements run in their own write transaction.
+
     Args:
         connection: Active database connection.
         query: SQL query string.
@@ -121,6 +393,72 @@ def execute_query(
         sqlite3.Error: If query execution fails.
     """
 
-    cursor = connection.execute(query, params)
-    connection.commit()
+    if query.lstrip()[:6].upper().startswith(READ_STATEMENTS):
+        return connection.execute(query, params)
+    with write_transaction(connection):
+        cursor = connection.execute(query, params)
     return cursor
+
+
+def execute_returning(
+    connection: sqlite3.Connection,
+    query: str,
+    params: Iterable[object],
+) -> list[sqlite3.Row]:
+    """Execute a write statement with a RETURNING clause.
+
+    The returned rows are read before the commit, which SQLite requires
+    once the statement has produced rows.
+
+    Args:
+        connection: Shared writer connection.
+        query: SQL write statement ending with RETURNING.
+        params: Query parameters.
+
+    Returns:
+        list[sqlite3.Row]: Rows produced by the RETURNING clause.
+
+    Raises:
+        sqlite3.Error: If query execution fails.
+    """
+
+    with write_transaction(connection):
+        rows = connection.execute(query, params).fetchall()
+    return rows
+
+
+def insert_rows(
+    connection: sqlite3.Connection,
+    insert: str,
+    placeholders: str,
+    rows: Iterable[Sequence[object]],
+) -> int:
+    """Insert rows with multi-row VALUES statements in one transaction.
+
+    Rows are sent INSERT_BATCH_SIZE at a time, so most batches reuse the
+    same cached statement and no batch approaches SQLite's variable limit.
+
+    Args:
+        connection: Shared writer connection.
+        insert: INSERT statement up to and including the VALUES keyword.
+        placeholders: Parameter group of one row, such as "(?, ?)".
+        rows: Query parameters, one sequence per row.
+
+    Returns:
+        int: Number of inserted rows.
+
+    Raises:
+        sqlite3.Error: If any batch fails; no row is written then.
+        OverflowError: If a value does not fit an SQLite integer; no row
+            is written then either.
+    """
+
+    pending = list(rows)
+    inserted = 0
+    with write_transaction(connection):
+        for start in range(0, len(pending), INSERT_BATCH_SIZE):
+            batch = pending[start:start + INSERT_BATCH_SIZE]
+            query = insert + ", ".join([placeholders] * len(batch))
+            params = [value for row in batch for value in row]
+            inserted += connection.execute(query, params).rowcount
+    return inserted
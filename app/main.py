@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import hashlib
+import math
+import threading
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from typing import Annotated, Any
+
+import orjson
+from fastapi import FastAPI, Header, HTTPException
+from fastapi import Path as PathParam
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 
-from app.db import init_db
+from app.db import DataVersion, get_data_version, init_db
 from app.models import (
+    BulkCreateResponse,
     DashboardPersonSummary,
     DashboardResponse,
     HouseholdCreate,
@@ -42,8 +54,11 @@ from app.models import (
 from app.repositories import (
     create_household,
     create_meal_expense,
+    create_meal_expenses,
+    create_mileage_entries,
     create_mileage_entry,
     create_other_expense,
+    create_other_expenses,
     create_person,
     create_vehicle,
     delete_household,
@@ -68,136 +83,130 @@ from app.repositories import (
     update_vehicle,
 )
 from app.services import (
-    build_vehicle_deductions,
-    calculate_meal_deduction,
-    calculate_meals_total,
-    calculate_other_expenses_total,
+    build_person_year_totals,
+    build_vehicle_deductions_by_person,
+    calculate_meal_deductions,
+    calculate_meals_totals_by_person,
+    calculate_other_expenses_totals_by_person,
+    to_cents,
 )
 from app.constants import MILEAGE_SCALE
 
-app = FastAPI(title="Frais Reels")
+app = FastAPI(title="Frais Reels", default_response_class=ORJSONResponse)
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 INDEX_FILE = STATIC_DIR / "index.html"
 ADMIN_FILE = STATIC_DIR / "admin.html"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 YEAR_MIN = 2000
 YEAR_MAX = 2100
-
-
-def validate_year(year: int) -> None:
-    """Role: Validate the dashboard year range.
-
-    Inputs: year integer.
-    Outputs: None.
-    Errors: Raises HTTPException for invalid year.
-    """
-
-    if year < YEAR_MIN or year > YEAR_MAX:
-        raise HTTPException(
-            status_code=400,
-            detail="Year must be between 2000 and 2100",
-        )
+STREAM_BATCH_SIZE = 256
+PersonSummary = tuple[list[VehicleSummary], float, float, float, float]
+SUMMARY_CACHE: dict[
+    tuple[int, int],
+    tuple[DataVersion, PersonSummary],
+] = {}
+SUMMARY_CACHE_SIZE = 1024
+SUMMARY_CACHE_LOCK = threading.Lock()
+DASHBOARD_CACHE: dict[int, tuple[DataVersion, str, bytes]] = {}
+YearPath = Annotated[int, PathParam(ge=YEAR_MIN, le=YEAR_MAX)]
 
 
 def build_person_summary(
     person_id: int,
     year: int,
-) -> tuple[list[VehicleSummary], float, float, float, float]:
+) -> PersonSummary:
     """Role: Build yearly summary data for a person.
 
+    Results are cached per person and year until the next database write;
+    once SUMMARY_CACHE_SIZE entries are held, the oldest one is evicted.
+
     Inputs: person_id and year.
     Outputs: vehicle summaries, vehicle total, meal total, other total, total.
     Errors: Propagates ValueError from services or repositories.
     """
 
-    vehicle_deductions = build_vehicle_deductions(person_id, year)
-    vehicles = [
-        VehicleSummary(
-            vehicle_id=item.vehicle_id,
-            vehicle_name=item.vehicle_name,
-            power_cv=item.power_cv,
-            total_km=item.total_km,
-            deduction=item.deduction,
-        )
-        for item in vehicle_deductions
-    ]
-    vehicle_total = sum(vehicle.deduction for vehicle in vehicle_deductions)
-    meals_total = calculate_meals_total(person_id, year)
-    other_total = calculate_other_expenses_total(person_id, year)
-    total = meals_total + other_total + vehicle_total
-    return vehicles, vehicle_total, meals_total, other_total, round(total, 2)
-
-
-def build_mileage_entries(
-    rows: list[Mapping[str, object]],
-) -> list[dict[str, object]]:
-    """Role: Build mileage entry dictionaries from rows.
-
-    Inputs: SQLite rows for mileage entries.
-    Outputs: List of mileage detail dictionaries.
+    version = get_data_version()
+    cached = SUMMARY_CACHE.get((person_id, year))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    vehicle_deductions, meals_total, other_total = (
+        build_person_year_totals(person_id, year)
+    )
+    summary = summarize_person(vehicle_deductions, meals_total, other_total)
+    with SUMMARY_CACHE_LOCK:
+        if len(SUMMARY_CACHE) >= SUMMARY_CACHE_SIZE:
+            SUMMARY_CACHE.pop(next(iter(SUMMARY_CACHE)))
+        SUMMARY_CACHE[(person_id, year)] = (version, summary)
+    return summary
+
+
+def summarize_person(
+    vehicle_deductions: list[VehicleSummary],
+    meals_total: float,
+    other_total: float,
+) -> PersonSummary:
+    """Role: Assemble yearly summary data from precomputed deductions.
+
+    Inputs: vehicle summaries, meal total and other expenses total.
+    Outputs: vehicle summaries, vehicle total, meal total, other total, total.
+    Errors: None.
+    """
+
+    vehicle_cents = sum(
+        [to_cents(item.deduction) for item in vehicle_deductions]
+    )
+    total_cents = vehicle_cents + to_cents(meals_total) + to_cents(other_total)
+    vehicle_total = vehicle_cents / 100
+    total = total_cents / 100
+    return vehicle_deductions, vehicle_total, meals_total, other_total, total
+
+
+def build_dashboard_person(
+    row: Mapping[str, Any],
+    vehicle_deductions: list[VehicleSummary],
+    meals_total: float,
+    other_total: float,
+) -> DashboardPersonSummary:
+    """Role: Build the dashboard summary of a person.
+
+    Inputs: person row with household name, vehicle deductions, meal total
+    and other expenses total.
+    Outputs: Dashboard person summary.
     Errors: None.
     """
 
-    return [
-        {
-            "id": row["id"],
-            "person_id": row["person_id"],
-            "vehicle_id": row["vehicle_id"],
-            "vehicle_name": row["vehicle_name"],
-            "year": row["year"],
-            "month": row["month"],
-            "km": row["km"],
-        }
-        for row in rows
-    ]
+    vehicles, vehicle_total, meals_total, other_total, total = (
+        summarize_person(vehicle_deductions, meals_total, other_total)
+    )
+    return DashboardPersonSummary(
+        person_id=row["person_id"],
+        household_name=row["household_name"],
+        first_name=row["first_name"],
+        last_name=row["last_name"],
+        vehicle_summaries=vehicles,
+        vehicle_deduction_total=vehicle_total,
+        meals_deduction=meals_total,
+        other_expenses=other_total,
+        total_deduction=total,
+    )
 
 
 def build_meal_entries(
-    rows: list[Mapping[str, object]],
-) -> list[dict[str, object]]:
-    """Role: Build meal expense dictionaries from rows.
+    rows: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Role: Add deductible amounts to meal expense rows.
 
-    Inputs: SQLite rows for meal expenses.
-    Outputs: List of meal detail dictionaries.
+    Inputs: Meal expense row dictionaries, updated in place.
+    Outputs: The same rows with their deductible amounts.
     Errors: None.
     """
 
-    return [
-        {
-            "id": row["id"],
-            "person_id": row["person_id"],
-            "year": row["year"],
-            "month": row["month"],
-            "meal_cost": row["meal_cost"],
-            "deductible_amount": calculate_meal_deduction(
-                float(row["meal_cost"])
-            ),
-        }
-        for row in rows
-    ]
-
-
-def build_other_entries(
-    rows: list[Mapping[str, object]],
-) -> list[dict[str, object]]:
-    """Role: Build other expense dictionaries from rows.
-
-    Inputs: SQLite rows for other expenses.
-    Outputs: List of other expense detail dictionaries.
-    Errors: None.
-    """
-
-    return [
-        {
-            "id": row["id"],
-            "person_id": row["person_id"],
-            "year": row["year"],
-            "description": row["description"],
-            "amount": row["amount"],
-            "attachment_path": row["attachment_path"],
-        }
-        for row in rows
-    ]
+    deductions = calculate_meal_deductions(
+        [float(row["meal_cost"]) for row in rows]
+    )
+    for row, deduction in zip(rows, deductions):
+        row["deductible_amount"] = deduction
+    return rows
 
 
 def build_mileage_scale_entries() -> list[MileageScaleEntry]:
@@ -226,6 +235,56 @@ def build_mileage_scale_entries() -> list[MileageScaleEntry]:
     return entries
 
 
+def iter_json_array(
+    rows: Sequence[dict[str, Any]],
+) -> Iterator[bytes]:
+    """Role: Encode rows as a JSON array, one batch of rows at a time.
+
+    Inputs: Row dictionaries whose keys match the response schema.
+    Outputs: Chunks of the JSON array bytes.
+    Errors: Propagates orjson.JSONEncodeError for unsupported values.
+    """
+
+    yield b"["
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        batch = rows[start:start + STREAM_BATCH_SIZE]
+        chunk = b",".join(orjson.dumps(row) for row in batch)
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]"
+
+
+def stream_json_rows(rows: Sequence[dict[str, Any]]) -> StreamingResponse:
+    """Role: Stream rows as a JSON array response.
+
+    Inputs: Row dictionaries whose keys match the response schema.
+    Outputs: Streaming JSON response.
+    Errors: None.
+    """
+
+    return StreamingResponse(
+        iter_json_array(rows),
+        media_type="application/json",
+    )
+
+
+def read_static_page(path: Path) -> bytes | None:
+    """Role: Load a static HTML page shipped with the application.
+
+    Inputs: Path to the HTML file.
+    Outputs: File content, or None if the file is missing.
+    Errors: Propagates OSError if the file cannot be read.
+    """
+
+    if not path.is_file():
+        return None
+    return path.read_bytes()
+
+
+MILEAGE_SCALE_ENTRIES = build_mileage_scale_entries()
+INDEX_PAGE = read_static_page(INDEX_FILE)
+ADMIN_PAGE = read_static_page(ADMIN_FILE)
+
+
 @app.on_event("startup")
 def on_startup() -> None:
     """Initialize database on startup."""
@@ -253,84 +312,84 @@ def mileage_scale() -> list[MileageScaleEntry]:
     """Role: Return the mileage scale values.
 
     Inputs: None.
-    Outputs: List of mileage scale entries.
+    Outputs: List of mileage scale entries built at import time.
     Errors: None.
     """
 
-    return build_mileage_scale_entries()
+    return MILEAGE_SCALE_ENTRIES
 
 
 @app.get("/dashboard")
-def serve_dashboard() -> FileResponse:
+def serve_dashboard() -> HTMLResponse:
     """Role: Serve the dashboard HTML page.
 
     Inputs: None.
-    Outputs: HTML file response for the dashboard.
+    Outputs: HTML response for the dashboard, read once at import time.
     Errors: 404 if the dashboard file is missing.
     """
 
-    if not INDEX_FILE.exists():
+    if INDEX_PAGE is None:
         raise HTTPException(status_code=404, detail="Dashboard not found")
-    return FileResponse(INDEX_FILE)
+    return HTMLResponse(INDEX_PAGE)
 
 
 @app.get("/admin")
-def serve_admin() -> FileResponse:
+def serve_admin() -> HTMLResponse:
     """Role: Serve the admin HTML page.
 
     Inputs: None.
-    Outputs: HTML file response for the admin page.
+    Outputs: HTML response for the admin page, read once at import time.
     Errors: 404 if the admin file is missing.
     """
 
-    if not ADMIN_FILE.exists():
+    if ADMIN_PAGE is None:
         raise HTTPException(status_code=404, detail="Admin page not found")
-    return FileResponse(ADMIN_FILE)
+    return HTMLResponse(ADMIN_PAGE)
 
 
 @app.post("/households", response_model=HouseholdResponse)
-def create_household_endpoint(payload: HouseholdCreate) -> HouseholdResponse:
+def create_household_endpoint(payload: HouseholdCreate) -> dict[str, object]:
     """Create a household."""
 
     row = create_household(payload.name)
-    return HouseholdResponse(id=row["id"], name=row["name"])
+    return dict(row)
 
 
 @app.get("/households", response_model=list[HouseholdResponse])
-def list_households_endpoint() -> list[HouseholdResponse]:
+def list_households_endpoint() -> StreamingResponse:
     """List all households."""
 
     rows = fetch_households()
-    return [HouseholdResponse(id=row["id"], name=row["name"]) for row in rows]
+    return stream_json_rows(rows)
 
 
 @app.put("/households/{household_id}", response_model=HouseholdResponse)
 def update_household_endpoint(
     household_id: int,
     payload: HouseholdUpdate,
-) -> HouseholdResponse:
+) -> dict[str, object]:
     """Update a household."""
 
     try:
         row = update_household(household_id, payload.name)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return HouseholdResponse(id=row["id"], name=row["name"])
+    return dict(row)
 
 
 @app.delete("/households/{household_id}", response_model=HouseholdResponse)
-def delete_household_endpoint(household_id: int) -> HouseholdResponse:
+def delete_household_endpoint(household_id: int) -> dict[str, object]:
     """Delete a household."""
 
     try:
         row = delete_household(household_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return HouseholdResponse(id=row["id"], name=row["name"])
+    return dict(row)
 
 
 @app.post("/persons", response_model=PersonResponse)
-def create_person_endpoint(payload: PersonCreate) -> PersonResponse:
+def create_person_endpoint(payload: PersonCreate) -> dict[str, object]:
     """Create a person."""
 
     try:
@@ -338,36 +397,22 @@ def create_person_endpoint(payload: PersonCreate) -> PersonResponse:
                             payload.last_name)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return PersonResponse(
-        id=row["id"],
-        household_id=row["household_id"],
-        first_name=row["first_name"],
-        last_name=row["last_name"],
-    )
+    return dict(row)
 
 
 @app.get("/persons", response_model=list[PersonListResponse])
-def list_people_endpoint() -> list[PersonListResponse]:
+def list_people_endpoint() -> StreamingResponse:
     """List all people with their households."""
 
     rows = fetch_people_overview()
-    return [
-        PersonListResponse(
-            id=row["id"],
-            household_id=row["household_id"],
-            household_name=row["household_name"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-        )
-        for row in rows
-    ]
+    return stream_json_rows(rows)
 
 
 @app.put("/persons/{person_id}", response_model=PersonResponse)
 def update_person_endpoint(
     person_id: int,
     payload: PersonUpdate,
-) -> PersonResponse:
+) -> dict[str, object]:
     """Update a person."""
 
     try:
@@ -379,68 +424,44 @@ def update_person_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return PersonResponse(
-        id=row["id"],
-        household_id=row["household_id"],
-        first_name=row["first_name"],
-        last_name=row["last_name"],
-    )
+    return dict(row)
 
 
 @app.delete("/persons/{person_id}", response_model=PersonResponse)
-def delete_person_endpoint(person_id: int) -> PersonResponse:
+def delete_person_endpoint(person_id: int) -> dict[str, object]:
     """Delete a person."""
 
     try:
         row = delete_person(person_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return PersonResponse(
-        id=row["id"],
-        household_id=row["household_id"],
-        first_name=row["first_name"],
-        last_name=row["last_name"],
-    )
+    return dict(row)
 
 
 @app.post("/vehicles", response_model=VehicleResponse)
-def create_vehicle_endpoint(payload: VehicleCreate) -> VehicleResponse:
+def create_vehicle_endpoint(payload: VehicleCreate) -> dict[str, object]:
     """Create a vehicle."""
 
     try:
         row = create_vehicle(payload.person_id, payload.name, payload.power_cv)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return VehicleResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        name=row["name"],
-        power_cv=row["power_cv"],
-    )
+    return dict(row)
 
 
 @app.get("/vehicles", response_model=list[VehicleListResponse])
-def list_vehicles_endpoint() -> list[VehicleListResponse]:
+def list_vehicles_endpoint() -> StreamingResponse:
     """List all vehicles with owner names."""
 
     rows = fetch_vehicles_with_people()
-    return [
-        VehicleListResponse(
-            id=row["id"],
-            person_id=row["person_id"],
-            person_name=f"{row['first_name']} {row['last_name']}",
-            name=row["name"],
-            power_cv=row["power_cv"],
-        )
-        for row in rows
-    ]
+    return stream_json_rows(rows)
 
 
 @app.put("/vehicles/{vehicle_id}", response_model=VehicleResponse)
 def update_vehicle_endpoint(
     vehicle_id: int,
     payload: VehicleUpdate,
-) -> VehicleResponse:
+) -> dict[str, object]:
     """Update a vehicle."""
 
     try:
@@ -452,34 +473,24 @@ def update_vehicle_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return VehicleResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        name=row["name"],
-        power_cv=row["power_cv"],
-    )
+    return dict(row)
 
 
 @app.delete("/vehicles/{vehicle_id}", response_model=VehicleResponse)
-def delete_vehicle_endpoint(vehicle_id: int) -> VehicleResponse:
+def delete_vehicle_endpoint(vehicle_id: int) -> dict[str, object]:
     """Delete a vehicle."""
 
     try:
         row = delete_vehicle(vehicle_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return VehicleResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        name=row["name"],
-        power_cv=row["power_cv"],
-    )
+    return dict(row)
 
 
 @app.post("/mileage", response_model=MileageEntryResponse)
 def create_mileage_entry_endpoint(
     payload: MileageEntryCreate,
-) -> MileageEntryResponse:
+) -> dict[str, object]:
     """Create a mileage entry."""
 
     try:
@@ -492,21 +503,27 @@ def create_mileage_entry_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MileageEntryResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        vehicle_id=row["vehicle_id"],
-        year=row["year"],
-        month=row["month"],
-        km=row["km"],
+    return dict(row)
+
+
+@app.post("/mileage/bulk", response_model=BulkCreateResponse)
+def create_mileage_entries_endpoint(
+    payload: list[MileageEntryCreate],
+) -> dict[str, object]:
+    """Create mileage entries in a single transaction."""
+
+    created = create_mileage_entries(
+        (item.person_id, item.vehicle_id, item.year, item.month, item.km)
+        for item in payload
     )
+    return {"created": created}
 
 
 @app.put("/mileage/{entry_id}", response_model=MileageEntryResponse)
 def update_mileage_entry_endpoint(
     entry_id: int,
     payload: MileageEntryUpdate,
-) -> MileageEntryResponse:
+) -> dict[str, object]:
     """Update a mileage entry."""
 
     try:
@@ -520,38 +537,24 @@ def update_mileage_entry_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MileageEntryResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        vehicle_id=row["vehicle_id"],
-        year=row["year"],
-        month=row["month"],
-        km=row["km"],
-    )
+    return dict(row)
 
 
 @app.delete("/mileage/{entry_id}", response_model=MileageEntryResponse)
-def delete_mileage_entry_endpoint(entry_id: int) -> MileageEntryResponse:
+def delete_mileage_entry_endpoint(entry_id: int) -> dict[str, object]:
     """Delete a mileage entry."""
 
     try:
         row = delete_mileage_entry(entry_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MileageEntryResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        vehicle_id=row["vehicle_id"],
-        year=row["year"],
-        month=row["month"],
-        km=row["km"],
-    )
+    return dict(row)
 
 
 @app.post("/meals", response_model=MealExpenseResponse)
 def create_meal_expense_endpoint(
     payload: MealExpenseCreate,
-) -> MealExpenseResponse:
+) -> dict[str, object]:
     """Create a meal expense."""
 
     try:
@@ -563,20 +566,27 @@ def create_meal_expense_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MealExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        month=row["month"],
-        meal_cost=row["meal_cost"],
+    return dict(row)
+
+
+@app.post("/meals/bulk", response_model=BulkCreateResponse)
+def create_meal_expenses_endpoint(
+    payload: list[MealExpenseCreate],
+) -> dict[str, object]:
+    """Create meal expenses in a single transaction."""
+
+    created = create_meal_expenses(
+        (item.person_id, item.year, item.month, item.meal_cost)
+        for item in payload
     )
+    return {"created": created}
 
 
 @app.put("/meals/{expense_id}", response_model=MealExpenseResponse)
 def update_meal_expense_endpoint(
     expense_id: int,
     payload: MealExpenseUpdate,
-) -> MealExpenseResponse:
+) -> dict[str, object]:
     """Update a meal expense."""
 
     try:
@@ -589,38 +599,26 @@ def update_meal_expense_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MealExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        month=row["month"],
-        meal_cost=row["meal_cost"],
-    )
+    return dict(row)
 
 
 @app.delete("/meals/{expense_id}", response_model=MealExpenseResponse)
 def delete_meal_expense_endpoint(
     expense_id: int,
-) -> MealExpenseResponse:
+) -> dict[str, object]:
     """Delete a meal expense."""
 
     try:
         row = delete_meal_expense(expense_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return MealExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        month=row["month"],
-        meal_cost=row["meal_cost"],
-    )
+    return dict(row)
 
 
 @app.post("/other-expenses", response_model=OtherExpenseResponse)
 def create_other_expense_endpoint(
     payload: OtherExpenseCreate,
-) -> OtherExpenseResponse:
+) -> dict[str, object]:
     """Create another professional expense."""
 
     try:
@@ -633,21 +631,33 @@ def create_other_expense_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return OtherExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        description=row["description"],
-        amount=row["amount"],
-        attachment_path=row["attachment_path"],
+    return dict(row)
+
+
+@app.post("/other-expenses/bulk", response_model=BulkCreateResponse)
+def create_other_expenses_endpoint(
+    payload: list[OtherExpenseCreate],
+) -> dict[str, object]:
+    """Create other professional expenses in a single transaction."""
+
+    created = create_other_expenses(
+        (
+            item.person_id,
+            item.year,
+            item.description,
+            item.amount,
+            item.attachment_path,
+        )
+        for item in payload
     )
+    return {"created": created}
 
 
 @app.put("/other-expenses/{expense_id}", response_model=OtherExpenseResponse)
 def update_other_expense_endpoint(
     expense_id: int,
     payload: OtherExpenseUpdate,
-) -> OtherExpenseResponse:
+) -> dict[str, object]:
     """Update another professional expense."""
 
     try:
@@ -661,43 +671,35 @@ def update_other_expense_endpoint(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return OtherExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        description=row["description"],
-        amount=row["amount"],
-        attachment_path=row["attachment_path"],
-    )
+    return dict(row)
 
 
 @app.delete("/other-expenses/{expense_id}",
             response_model=OtherExpenseResponse)
 def delete_other_expense_endpoint(
     expense_id: int,
-) -> OtherExpenseResponse:
+) -> dict[str, object]:
     """Delete another professional expense."""
 
     try:
         row = delete_other_expense(expense_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return OtherExpenseResponse(
-        id=row["id"],
-        person_id=row["person_id"],
-        year=row["year"],
-        description=row["description"],
-        amount=row["amount"],
-        attachment_path=row["attachment_path"],
-    )
+    return dict(row)
 
 
 @app.get("/persons/{person_id}/summary/{year}",
          response_model=PersonYearSummary)
-def get_person_summary(person_id: int, year: int) -> PersonYearSummary:
-    """Get yearly deduction summary for a person."""
+def get_person_summary(
+    person_id: int,
+    year: YearPath,
+) -> ORJSONResponse:
+    """Get yearly deduction summary for a person.
+
+    The summary dataclass is encoded directly by orjson, skipping FastAPI's
+    response_model serialization; response_model documents the schema.
+    """
 
-    validate_year(year)
     try:
         fetch_person(person_id)
     except ValueError as exc:
@@ -706,40 +708,43 @@ def get_person_summary(person_id: int, year: int) -> PersonYearSummary:
         person_id,
         year,
     )
-    return PersonYearSummary(
+    summary = PersonYearSummary(
         person_id=person_id,
         year=year,
         vehicle_summaries=vehicles,
         meals_deduction=meals_total,
         other_expenses=other_total,
-        total_deduction=round(total, 2),
+        total_deduction=total,
     )
+    return ORJSONResponse(summary)
 
 
 @app.get("/api/people/{person_id}/details/{year}",
          response_model=PersonYearDetail)
-def get_person_year_detail(person_id: int, year: int) -> PersonYearDetail:
-    """Get detailed yearly operations for a person."""
+def get_person_year_detail(
+    person_id: int,
+    year: YearPath,
+) -> PersonYearDetail:
+    """Get detailed yearly operations for a person.
+
+    The totals come from build_person_summary, so they always match the
+    summary and the dashboard.
+    """
 
-    validate_year(year)
     try:
         fetch_person(person_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    mileage_rows = fetch_mileage_entries_by_year(person_id, year)
-    meal_rows = fetch_meal_expenses_by_year(person_id, year)
-    other_rows = fetch_other_expenses_by_year(person_id, year)
-    mileage_entries = build_mileage_entries(mileage_rows)
-    meal_expenses = build_meal_entries(meal_rows)
-    other_expenses = build_other_entries(other_rows)
-    mileage_total_km = sum(entry["km"] for entry in mileage_entries)
-    vehicle_deductions = build_vehicle_deductions(person_id, year)
-    mileage_deduction_total = sum(
-        item.deduction for item in vehicle_deductions
+    mileage_entries = fetch_mileage_entries_by_year(person_id, year)
+    meal_expenses = build_meal_entries(
+        fetch_meal_expenses_by_year(person_id, year)
+    )
+    other_expenses = fetch_other_expenses_by_year(person_id, year)
+    mileage_total_km = math.fsum([entry["km"] for entry in mileage_entries])
+    _, vehicle_total, meals_total, other_total, total = build_person_summary(
+        person_id,
+        year,
     )
-    meals_total = calculate_meals_total(person_id, year)
-    other_total = calculate_other_expenses_total(person_id, year)
-    total = meals_total + other_total + mileage_deduction_total
     return PersonYearDetail(
         person_id=person_id,
         year=year,
@@ -747,48 +752,104 @@ def get_person_year_detail(person_id: int, year: int) -> PersonYearDetail:
         meal_expenses=meal_expenses,
         other_expenses=other_expenses,
         mileage_total_km=round(mileage_total_km, 2),
-        mileage_deduction_total=round(mileage_deduction_total, 2),
+        mileage_deduction_total=vehicle_total,
         meals_deduction_total=meals_total,
         other_expenses_total=other_total,
-        total_deduction=round(total, 2),
+        total_deduction=total,
     )
 
 
 @app.get("/api/dashboard/{year}", response_model=DashboardResponse)
-def get_dashboard(year: int) -> DashboardResponse:
+def get_dashboard(
+    year: YearPath,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Role: Provide the yearly dashboard summary.
 
-    Inputs: year path parameter.
+    The encoded body and its ETag are cached per year until the next
+    database write, and a matching If-None-Match is answered with 304.
+
+    Inputs: year path parameter and optional If-None-Match header.
+    Outputs: Dashboard summary with per-person deductions, encoded
+    directly by orjson so FastAPI's response_model serialization is skipped.
+    Errors: 404 if no people exist for the dashboard, 422 if the year is
+    outside the supported range.
+    """
+
+    version = get_data_version()
+    cached = DASHBOARD_CACHE.get(year)
+    if cached is None or cached[0] != version:
+        body = orjson.dumps(build_dashboard(year))
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        cached = (version, etag, body)
+        DASHBOARD_CACHE[year] = cached
+    _, etag, body = cached
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+def build_dashboard(year: int) -> DashboardResponse:
+    """Role: Build the yearly dashboard summary from the database.
+
+    Inputs: year.
     Outputs: Dashboard summary with per-person deductions.
     Errors: 404 if no people exist for the dashboard.
     """
 
-    validate_year(year)
+    people = list(iter_dashboard_people(year))
+    total_cents = sum([to_cents(person.total_deduction) for person in people])
+    return DashboardResponse(
+        year=year,
+        people=people,
+        total_deduction=round(total_cents / 100, 2),
+    )
+
+
+def iter_dashboard_people(year: int) -> Iterator[DashboardPersonSummary]:
+    """Role: Build dashboard person summaries one person at a time.
+
+    The yearly totals are fetched eagerly so a missing dashboard fails
+    before any summary is produced.
+
+    Inputs: year.
+    Outputs: Iterator of dashboard person summaries.
+    Errors: 404 if no people exist for the dashboard.
+    """
+
     people_rows = fetch_people_with_households()
     if not people_rows:
         raise HTTPException(status_code=404, detail="No people found")
-    people: list[DashboardPersonSummary] = []
-    total_deduction = 0.0
-    for row in people_rows:
-        vehicles, vehicle_total, meals_total, other_total, total = (
-            build_person_summary(row["person_id"], year)
-        )
-        total_deduction += total
-        people.append(
-            DashboardPersonSummary(
-                person_id=row["person_id"],
-                household_name=row["household_name"],
-                first_name=row["first_name"],
-                last_name=row["last_name"],
-                vehicle_summaries=vehicles,
-                vehicle_deduction_total=round(vehicle_total, 2),
-                meals_deduction=meals_total,
-                other_expenses=other_total,
-                total_deduction=total,
-            )
+    deductions_by_person = build_vehicle_deductions_by_person(year)
+    meals_by_person = calculate_meals_totals_by_person(year)
+    other_by_person = calculate_other_expenses_totals_by_person(year)
+    return (
+        build_dashboard_person(
+            row,
+            deductions_by_person.get(row["person_id"], []),
+            meals_by_person.get(row["person_id"], 0.0),
+            other_by_person.get(row["person_id"], 0.0),
         )
-    return DashboardResponse(
-        year=year,
-        people=people,
-        total_deduction=round(total_deduction, 2),
+        for row in people_rows
+    )
+
+
+@app.get("/api/dashboard/{year}/stream")
+def stream_dashboard(year: YearPath) -> StreamingResponse:
+    """Role: Stream the yearly dashboard as newline-delimited JSON.
+
+    Inputs: year path parameter.
+    Outputs: One JSON line per dashboard person summary.
+    Errors: 404 if no people exist for the dashboard, 422 if the year is
+    outside the supported range.
+    """
+
+    people = iter_dashboard_people(year)
+    return StreamingResponse(
+        (orjson.dumps(person) + b"\n" for person in people),
+        media_type="application/x-ndjson",
     )
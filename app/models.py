@@ -1,7 +1,13 @@
-"""Data models for API requests and responses."""
+"""Data models for API requests and responses.
+
+Summary responses built by the application itself are plain dataclasses:
+they need no validation and orjson serializes them natively.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 
@@ -174,6 +180,12 @@ class OtherExpenseResponse(BaseModel):
     attachment_path: str | None
 
 
+class BulkCreateResponse(BaseModel):
+    """Represents the result of a bulk creation request."""
+
+    created: int
+
+
 class MileageScaleBracket(BaseModel):
     """Represents a mileage scale bracket."""
 
@@ -199,21 +211,6 @@ class OtherExpenseUpdate(BaseModel):
     attachment_path: str | None = Field(default=None, max_length=255)
 
 
-class MileageScaleBracketResponse(BaseModel):
-    """Represents a mileage scale bracket response."""
-
-    max_km: int | None
-    rate: float
-    fixed: float
-
-
-class MileageScaleResponse(BaseModel):
-    """Represents a mileage scale response."""
-
-    power_cv: int
-    brackets: list[MileageScaleBracketResponse]
-
-
 class MileageEntryDetail(BaseModel):
     """Represents a detailed mileage entry."""
 
@@ -263,7 +260,8 @@ class PersonYearDetail(BaseModel):
     total_deduction: float
 
 
-class VehicleSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class VehicleSummary:
     """Represents mileage summary for a vehicle."""
 
     vehicle_id: int
@@ -273,7 +271,8 @@ class VehicleSummary(BaseModel):
     deduction: float
 
 
-class PersonYearSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PersonYearSummary:
     """Represents the yearly tax deduction summary for a person."""
 
     person_id: int
@@ -284,7 +283,8 @@ class PersonYearSummary(BaseModel):
     total_deduction: float
 
 
-class DashboardPersonSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DashboardPersonSummary:
     """Represents a person summary for the dashboard."""
 
     person_id: int
@@ -298,7 +298,8 @@ class DashboardPersonSummary(BaseModel):
     total_deduction: float
 
 
-class DashboardResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DashboardResponse:
     """Represents the yearly dashboard response."""
 
     year: int
@@ -3,9 +3,61 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+import threading
+from typing import Any, Iterable
+
+from app.db import (
+    DataVersion,
+    borrow_reader,
+    execute_query,
+    execute_returning,
+    get_connection,
+    get_data_version,
+    insert_rows,
+)
+
+MEAL_DEDUCTION_SUM = "meal_deductions_total(meal_cost)"
+OTHER_EXPENSES_SUM = "other_expenses_total(amount)"
+YEAR_BUNDLE_QUERY = (
+    "SELECT 'mileage' AS kind, vehicles.id AS vehicle_id, "
+    "vehicles.name AS vehicle_name, vehicles.power_cv AS power_cv, "
+    "SUM(mileage_entries.km) AS total_km, NULL AS amount "
+    "FROM mileage_entries "
+    "JOIN vehicles ON vehicles.id = mileage_entries.vehicle_id "
+    "WHERE mileage_entries.person_id = ? AND mileage_entries.year = ? "
+    "GROUP BY vehicles.id "
+    "UNION ALL "
+    f"SELECT 'meal', NULL, NULL, NULL, NULL, {MEAL_DEDUCTION_SUM} "
+    "FROM meal_expenses WHERE person_id = ? AND year = ? "
+    "GROUP BY person_id "
+    "UNION ALL "
+    f"SELECT 'other', NULL, NULL, NULL, NULL, {OTHER_EXPENSES_SUM} "
+    "FROM other_expenses WHERE person_id = ? AND year = ? "
+    "GROUP BY person_id"
+)
+MEAL_DEDUCTIONS_BY_YEAR_QUERY = (
+    f"SELECT person_id, {MEAL_DEDUCTION_SUM} AS total_deduction "
+    "FROM meal_expenses WHERE year = ? "
+    "GROUP BY person_id"
+)
+PERSON_CACHE: dict[int, tuple[DataVersion, sqlite3.Row]] = {}
+PERSON_CACHE_SIZE = 1024
+PERSON_CACHE_LOCK = threading.Lock()
+
+
+def fetch_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    """Fetch all rows as dictionaries, resolving column names once.
 
-from app.db import execute_query, get_connection
+    Args:
+        cursor: SQLite cursor with results.
+
+    Returns:
+        list[dict[str, Any]]: Rows keyed by column name.
+    """
+
+    cursor.row_factory = None
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
 
 def fetch_one(cursor: sqlite3.Cursor) -> sqlite3.Row:
@@ -27,6 +79,24 @@ def fetch_one(cursor: sqlite3.Cursor) -> sqlite3.Row:
     return row
 
 
+def fetch_returned(rows: list[sqlite3.Row]) -> sqlite3.Row:
+    """Return the row produced by a RETURNING clause or raise a ValueError.
+
+    Args:
+        rows: Rows returned by a write statement.
+
+    Returns:
+        sqlite3.Row: The first returned row.
+
+    Raises:
+        ValueError: If the statement matched no row.
+    """
+
+    if not rows:
+        raise ValueError("Resource not found")
+    return rows[0]
+
+
 def create_household(name: str) -> sqlite3.Row:
     """Create a household.
 
@@ -37,10 +107,9 @@ def create_household(name: str) -> sqlite3.Row:
         sqlite3.Row: Created household row.
     """
 
-    query = "INSERT INTO households (name) VALUES (?)"
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, (name,))
-        return fetch_household(cursor.lastrowid)
+    query = "INSERT INTO households (name) VALUES (?) RETURNING id, name"
+    connection = get_connection()
+    return execute_returning(connection, query, (name,))[0]
 
 
 def fetch_household(household_id: int) -> sqlite3.Row:
@@ -54,7 +123,7 @@ def fetch_household(household_id: int) -> sqlite3.Row:
     """
 
     query = "SELECT id, name FROM households WHERE id = ?"
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (household_id,))
         return fetch_one(cursor)
 
@@ -77,17 +146,24 @@ def create_person(
 
     query = (
         "INSERT INTO persons (household_id, first_name, last_name) "
-        "VALUES (?, ?, ?)"
+        "VALUES (?, ?, ?) "
+        "RETURNING id, household_id, first_name, last_name"
     )
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, (household_id, first_name,
-                                                 last_name))
-        return fetch_person(cursor.lastrowid)
+    connection = get_connection()
+    return execute_returning(
+        connection,
+        query,
+        (household_id, first_name, last_name),
+    )[0]
 
 
 def fetch_person(person_id: int) -> sqlite3.Row:
     """Fetch a person by ID.
 
+    Rows are cached until the next database write, since every summary
+    and detail request looks its person up first; once PERSON_CACHE_SIZE
+    entries are held, the oldest one is evicted.
+
     Args:
         person_id: Person identifier.
 
@@ -95,13 +171,22 @@ def fetch_person(person_id: int) -> sqlite3.Row:
         sqlite3.Row: Person row.
     """
 
+    version = get_data_version()
+    cached = PERSON_CACHE.get(person_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
     query = (
         "SELECT id, household_id, first_name, last_name "
         "FROM persons WHERE id = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (person_id,))
-        return fetch_one(cursor)
+        row = fetch_one(cursor)
+    with PERSON_CACHE_LOCK:
+        if len(PERSON_CACHE) >= PERSON_CACHE_SIZE:
+            PERSON_CACHE.pop(next(iter(PERSON_CACHE)))
+        PERSON_CACHE[person_id] = (version, row)
+    return row
 
 
 def fetch_people_with_households() -> list[sqlite3.Row]:
@@ -120,12 +205,12 @@ def fetch_people_with_households() -> list[sqlite3.Row]:
         "JOIN households ON households.id = persons.household_id "
         "ORDER BY persons.last_name, persons.first_name"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, ())
-        return list(cursor.fetchall())
+        return cursor.fetchall()
 
 
-def fetch_people_overview() -> list[sqlite3.Row]:
+def fetch_people_overview() -> list[dict[str, Any]]:
     """Role: Fetch all people with household metadata and identifiers.
 
     Inputs: None.
@@ -142,22 +227,22 @@ def fetch_people_overview() -> list[sqlite3.Row]:
         "JOIN households ON households.id = persons.household_id "
         "ORDER BY persons.last_name, persons.first_name"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, ())
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
 
 
-def fetch_households() -> list[sqlite3.Row]:
+def fetch_households() -> list[dict[str, Any]]:
     """Fetch all households.
 
     Returns:
-        list[sqlite3.Row]: Household rows.
+        list[dict[str, Any]]: Household rows.
     """
 
     query = "SELECT id, name FROM households ORDER BY name"
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, ())
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
 
 
 def create_vehicle(
@@ -178,11 +263,15 @@ def create_vehicle(
 
     query = (
         "INSERT INTO vehicles (person_id, name, power_cv) "
-        "VALUES (?, ?, ?)"
+        "VALUES (?, ?, ?) "
+        "RETURNING id, person_id, name, power_cv"
     )
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, (person_id, name, power_cv))
-        return fetch_vehicle(cursor.lastrowid)
+    connection = get_connection()
+    return execute_returning(
+        connection,
+        query,
+        (person_id, name, power_cv),
+    )[0]
 
 
 def fetch_vehicle(vehicle_id: int) -> sqlite3.Row:
@@ -196,29 +285,30 @@ def fetch_vehicle(vehicle_id: int) -> sqlite3.Row:
     """
 
     query = "SELECT id, person_id, name, power_cv FROM vehicles WHERE id = ?"
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (vehicle_id,))
         return fetch_one(cursor)
 
 
-def fetch_vehicles_with_people() -> list[sqlite3.Row]:
+def fetch_vehicles_with_people() -> list[dict[str, Any]]:
     """Fetch vehicles with owner names.
 
     Returns:
-        list[sqlite3.Row]: Vehicle rows with person names.
+        list[dict[str, Any]]: Vehicle rows with the owner full name as
+        person_name.
     """
 
     query = (
         "SELECT vehicles.id AS id, vehicles.person_id AS person_id, "
         "vehicles.name AS name, vehicles.power_cv AS power_cv, "
-        "persons.first_name AS first_name, persons.last_name AS last_name "
+        "persons.first_name || ' ' || persons.last_name AS person_name "
         "FROM vehicles "
         "JOIN persons ON persons.id = vehicles.person_id "
         "ORDER BY persons.last_name, vehicles.name"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, ())
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
 
 
 def create_mileage_entry(
@@ -243,15 +333,35 @@ def create_mileage_entry(
 
     query = (
         "INSERT INTO mileage_entries (person_id, vehicle_id, year, month, km) "
-        "VALUES (?, ?, ?, ?, ?)"
+        "VALUES (?, ?, ?, ?, ?) "
+        "RETURNING id, person_id, vehicle_id, year, month, km"
     )
-    with get_connection() as connection:
-        cursor = execute_query(
-            connection,
-            query,
-            (person_id, vehicle_id, year, month, km),
-        )
-        return fetch_mileage_entry(cursor.lastrowid)
+    connection = get_connection()
+    return execute_returning(
+        connection,
+        query,
+        (person_id, vehicle_id, year, month, km),
+    )[0]
+
+
+def create_mileage_entries(
+    rows: Iterable[tuple[int, int, int, int, float]],
+) -> int:
+    """Create mileage entries in a single transaction.
+
+    Args:
+        rows: Tuples of person_id, vehicle_id, year, month and km.
+
+    Returns:
+        int: Number of created mileage entries.
+    """
+
+    insert = (
+        "INSERT INTO mileage_entries (person_id, vehicle_id, year, month, km) "
+        "VALUES "
+    )
+    connection = get_connection()
+    return insert_rows(connection, insert, "(?, ?, ?, ?, ?)", rows)
 
 
 def fetch_mileage_entry(entry_id: int) -> sqlite3.Row:
@@ -268,7 +378,7 @@ def fetch_mileage_entry(entry_id: int) -> sqlite3.Row:
         "SELECT id, person_id, vehicle_id, year, month, km "
         "FROM mileage_entries WHERE id = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (entry_id,))
         return fetch_one(cursor)
 
@@ -276,15 +386,15 @@ def fetch_mileage_entry(entry_id: int) -> sqlite3.Row:
 def fetch_mileage_entries_by_year(
     person_id: int,
     year: int,
-) -> list[sqlite3.Row]:
-    """Fetch mileage entries for a year with vehicle names.
+) -> list[dict[str, Any]]:
+    """Fetch mileage entries for a year with vehicle names and powers.
 
     Args:
         person_id: Person identifier.
         year: Tax year.
 
     Returns:
-        list[sqlite3.Row]: Mileage entry rows.
+        list[dict[str, Any]]: Mileage entry rows.
     """
 
     query = (
@@ -292,15 +402,16 @@ def fetch_mileage_entries_by_year(
         "mileage_entries.person_id AS person_id, "
         "mileage_entries.vehicle_id AS vehicle_id, "
         "mileage_entries.year AS year, mileage_entries.month AS month, "
-        "mileage_entries.km AS km, vehicles.name AS vehicle_name "
+        "mileage_entries.km AS km, vehicles.name AS vehicle_name, "
+        "vehicles.power_cv AS power_cv "
         "FROM mileage_entries "
         "JOIN vehicles ON vehicles.id = mileage_entries.vehicle_id "
         "WHERE mileage_entries.person_id = ? AND mileage_entries.year = ? "
         "ORDER BY mileage_entries.month"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (person_id, year))
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
 
 
 def create_meal_expense(
@@ -323,12 +434,35 @@ def create_meal_expense(
 
     query = (
         "INSERT INTO meal_expenses (person_id, year, month, meal_cost) "
-        "VALUES (?, ?, ?, ?)"
+        "VALUES (?, ?, ?, ?) "
+        "RETURNING id, person_id, year, month, meal_cost"
     )
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, (person_id, year, month,
-                                                 meal_cost))
-        return fetch_meal_expense(cursor.lastrowid)
+    connection = get_connection()
+    return execute_returning(
+        connection,
+        query,
+        (person_id, year, month, meal_cost),
+    )[0]
+
+
+def create_meal_expenses(
+    rows: Iterable[tuple[int, int, int, float]],
+) -> int:
+    """Create meal expenses in a single transaction.
+
+    Args:
+        rows: Tuples of person_id, year, month and meal_cost.
+
+    Returns:
+        int: Number of created meal expenses.
+    """
+
+    insert = (
+        "INSERT INTO meal_expenses (person_id, year, month, meal_cost) "
+        "VALUES "
+    )
+    connection = get_connection()
+    return insert_rows(connection, insert, "(?, ?, ?, ?)", rows)
 
 
 def fetch_meal_expense(expense_id: int) -> sqlite3.Row:
@@ -345,7 +479,7 @@ def fetch_meal_expense(expense_id: int) -> sqlite3.Row:
         "SELECT id, person_id, year, month, meal_cost "
         "FROM meal_expenses WHERE id = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (expense_id,))
         return fetch_one(cursor)
 
@@ -373,7 +507,8 @@ def create_other_expense(
     query = (
         "INSERT INTO other_expenses "
         "(person_id, year, description, amount, attachment_path) "
-        "VALUES (?, ?, ?, ?, ?)"
+        "VALUES (?, ?, ?, ?, ?) "
+        "RETURNING id, person_id, year, description, amount, attachment_path"
     )
     params: Iterable[object] = (
         person_id,
@@ -382,9 +517,30 @@ def create_other_expense(
         amount,
         attachment_path,
     )
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, params)
-        return fetch_other_expense(cursor.lastrowid)
+    connection = get_connection()
+    return execute_returning(connection, query, params)[0]
+
+
+def create_other_expenses(
+    rows: Iterable[tuple[int, int, str, float, str | None]],
+) -> int:
+    """Create other expenses in a single transaction.
+
+    Args:
+        rows: Tuples of person_id, year, description, amount and
+            attachment_path.
+
+    Returns:
+        int: Number of created other expenses.
+    """
+
+    insert = (
+        "INSERT INTO other_expenses "
+        "(person_id, year, description, amount, attachment_path) "
+        "VALUES "
+    )
+    connection = get_connection()
+    return insert_rows(connection, insert, "(?, ?, ?, ?, ?)", rows)
 
 
 def fetch_other_expense(expense_id: int) -> sqlite3.Row:
@@ -401,7 +557,7 @@ def fetch_other_expense(expense_id: int) -> sqlite3.Row:
         "SELECT id, person_id, year, description, amount, attachment_path "
         "FROM other_expenses WHERE id = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (expense_id,))
         return fetch_one(cursor)
 
@@ -417,11 +573,10 @@ def update_household(household_id: int, name: str) -> sqlite3.Row:
         sqlite3.Row: Updated household row.
     """
 
-    fetch_household(household_id)
-    query = "UPDATE households SET name = ? WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (name, household_id))
-        return fetch_household(household_id)
+    query = "UPDATE households SET name = ? WHERE id = ? RETURNING id, name"
+    connection = get_connection()
+    rows = execute_returning(connection, query, (name, household_id))
+    return fetch_returned(rows)
 
 
 def update_person(
@@ -442,17 +597,16 @@ def update_person(
         sqlite3.Row: Updated person row.
     """
 
-    fetch_person(person_id)
-    fetch_household(household_id)
     query = (
         "UPDATE persons "
         "SET household_id = ?, first_name = ?, last_name = ? "
-        "WHERE id = ?"
+        "WHERE id = ? "
+        "AND EXISTS (SELECT 1 FROM households WHERE id = ?) "
+        "RETURNING id, household_id, first_name, last_name"
     )
-    params = (household_id, first_name, last_name, person_id)
-    with get_connection() as connection:
-        execute_query(connection, query, params)
-        return fetch_person(person_id)
+    params = (household_id, first_name, last_name, person_id, household_id)
+    connection = get_connection()
+    return fetch_returned(execute_returning(connection, query, params))
 
 
 def update_vehicle(
@@ -473,16 +627,15 @@ def update_vehicle(
         sqlite3.Row: Updated vehicle row.
     """
 
-    fetch_vehicle(vehicle_id)
-    fetch_person(person_id)
     query = (
         "UPDATE vehicles SET person_id = ?, name = ?, power_cv = ? "
-        "WHERE id = ?"
+        "WHERE id = ? "
+        "AND EXISTS (SELECT 1 FROM persons WHERE id = ?) "
+        "RETURNING id, person_id, name, power_cv"
     )
-    params = (person_id, name, power_cv, vehicle_id)
-    with get_connection() as connection:
-        execute_query(connection, query, params)
-        return fetch_vehicle(vehicle_id)
+    params = (person_id, name, power_cv, vehicle_id, person_id)
+    connection = get_connection()
+    return fetch_returned(execute_returning(connection, query, params))
 
 
 def update_mileage_entry(
@@ -507,18 +660,26 @@ def update_mileage_entry(
         sqlite3.Row: Updated mileage entry row.
     """
 
-    fetch_mileage_entry(entry_id)
-    fetch_person(person_id)
-    fetch_vehicle(vehicle_id)
     query = (
         "UPDATE mileage_entries "
         "SET person_id = ?, vehicle_id = ?, year = ?, month = ?, km = ? "
-        "WHERE id = ?"
+        "WHERE id = ? "
+        "AND EXISTS (SELECT 1 FROM persons WHERE id = ?) "
+        "AND EXISTS (SELECT 1 FROM vehicles WHERE id = ?) "
+        "RETURNING id, person_id, vehicle_id, year, month, km"
     )
-    params = (person_id, vehicle_id, year, month, km, entry_id)
-    with get_connection() as connection:
-        execute_query(connection, query, params)
-        return fetch_mileage_entry(entry_id)
+    params = (
+        person_id,
+        vehicle_id,
+        year,
+        month,
+        km,
+        entry_id,
+        person_id,
+        vehicle_id,
+    )
+    connection = get_connection()
+    return fetch_returned(execute_returning(connection, query, params))
 
 
 def update_meal_expense(
@@ -541,17 +702,16 @@ def update_meal_expense(
         sqlite3.Row: Updated meal expense row.
     """
 
-    fetch_meal_expense(expense_id)
-    fetch_person(person_id)
     query = (
         "UPDATE meal_expenses "
         "SET person_id = ?, year = ?, month = ?, meal_cost = ? "
-        "WHERE id = ?"
+        "WHERE id = ? "
+        "AND EXISTS (SELECT 1 FROM persons WHERE id = ?) "
+        "RETURNING id, person_id, year, month, meal_cost"
     )
-    params = (person_id, year, month, meal_cost, expense_id)
-    with get_connection() as connection:
-        execute_query(connection, query, params)
-        return fetch_meal_expense(expense_id)
+    params = (person_id, year, month, meal_cost, expense_id, person_id)
+    connection = get_connection()
+    return fetch_returned(execute_returning(connection, query, params))
 
 
 def update_other_expense(
@@ -576,13 +736,13 @@ def update_other_expense(
         sqlite3.Row: Updated other expense row.
     """
 
-    fetch_other_expense(expense_id)
-    fetch_person(person_id)
     query = (
         "UPDATE other_expenses "
         "SET person_id = ?, year = ?, description = ?, amount = ?, "
         "attachment_path = ? "
-        "WHERE id = ?"
+        "WHERE id = ? "
+        "AND EXISTS (SELECT 1 FROM persons WHERE id = ?) "
+        "RETURNING id, person_id, year, description, amount, attachment_path"
     )
     params: Iterable[object] = (
         person_id,
@@ -591,10 +751,10 @@ def update_other_expense(
         amount,
         attachment_path,
         expense_id,
+        person_id,
     )
-    with get_connection() as connection:
-        execute_query(connection, query, params)
-        return fetch_other_expense(expense_id)
+    connection = get_connection()
+    return fetch_returned(execute_returning(connection, query, params))
 
 
 def delete_household(household_id: int) -> sqlite3.Row:
@@ -607,11 +767,13 @@ def delete_household(household_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted household row.
     """
 
-    row = fetch_household(household_id)
-    query = "DELETE FROM households WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (household_id,))
-        return row
+    query = (
+        "DELETE FROM households WHERE id = ? "
+        "RETURNING id, name"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (household_id,))
+    return fetch_returned(rows)
 
 
 def delete_person(person_id: int) -> sqlite3.Row:
@@ -624,11 +786,13 @@ def delete_person(person_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted person row.
     """
 
-    row = fetch_person(person_id)
-    query = "DELETE FROM persons WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (person_id,))
-        return row
+    query = (
+        "DELETE FROM persons WHERE id = ? "
+        "RETURNING id, household_id, first_name, last_name"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (person_id,))
+    return fetch_returned(rows)
 
 
 def delete_vehicle(vehicle_id: int) -> sqlite3.Row:
@@ -641,11 +805,13 @@ def delete_vehicle(vehicle_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted vehicle row.
     """
 
-    row = fetch_vehicle(vehicle_id)
-    query = "DELETE FROM vehicles WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (vehicle_id,))
-        return row
+    query = (
+        "DELETE FROM vehicles WHERE id = ? "
+        "RETURNING id, person_id, name, power_cv"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (vehicle_id,))
+    return fetch_returned(rows)
 
 
 def delete_mileage_entry(entry_id: int) -> sqlite3.Row:
@@ -658,11 +824,13 @@ def delete_mileage_entry(entry_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted mileage entry row.
     """
 
-    row = fetch_mileage_entry(entry_id)
-    query = "DELETE FROM mileage_entries WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (entry_id,))
-        return row
+    query = (
+        "DELETE FROM mileage_entries WHERE id = ? "
+        "RETURNING id, person_id, vehicle_id, year, month, km"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (entry_id,))
+    return fetch_returned(rows)
 
 
 def delete_meal_expense(expense_id: int) -> sqlite3.Row:
@@ -675,11 +843,13 @@ def delete_meal_expense(expense_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted meal expense row.
     """
 
-    row = fetch_meal_expense(expense_id)
-    query = "DELETE FROM meal_expenses WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (expense_id,))
-        return row
+    query = (
+        "DELETE FROM meal_expenses WHERE id = ? "
+        "RETURNING id, person_id, year, month, meal_cost"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (expense_id,))
+    return fetch_returned(rows)
 
 
 def delete_other_expense(expense_id: int) -> sqlite3.Row:
@@ -692,45 +862,44 @@ def delete_other_expense(expense_id: int) -> sqlite3.Row:
         sqlite3.Row: Deleted other expense row.
     """
 
-    row = fetch_other_expense(expense_id)
-    query = "DELETE FROM other_expenses WHERE id = ?"
-    with get_connection() as connection:
-        execute_query(connection, query, (expense_id,))
-        return row
+    query = (
+        "DELETE FROM other_expenses WHERE id = ? "
+        "RETURNING id, person_id, year, description, amount, attachment_path"
+    )
+    connection = get_connection()
+    rows = execute_returning(connection, query, (expense_id,))
+    return fetch_returned(rows)
 
 
-def fetch_vehicle_km_by_year(
-    person_id: int,
-    year: int,
-) -> list[sqlite3.Row]:
-    """Fetch total km per vehicle for a year.
+def fetch_year_bundle(person_id: int, year: int) -> list[sqlite3.Row]:
+    """Fetch the yearly mileage, meal and other expense rows of a person.
+
+    The three kinds of rows come back from a single UNION ALL query and
+    are told apart by the kind column. Meal deductions and other expenses
+    are totalled by the meal_deductions_total and other_expenses_total
+    aggregates that app.services registers.
 
     Args:
         person_id: Person identifier.
         year: Tax year.
 
     Returns:
-        list[sqlite3.Row]: Rows with vehicle and total_km.
+        list[sqlite3.Row]: Rows with kind, vehicle_id, vehicle_name,
+        power_cv, total_km and amount. Mileage rows carry the vehicle and
+        total_km; the single meal row carries the yearly meal deduction
+        and the single other row the yearly total, both rounded to cents.
     """
 
-    query = (
-        "SELECT vehicles.id AS vehicle_id, vehicles.name AS vehicle_name, "
-        "vehicles.power_cv AS power_cv, "
-        "SUM(mileage_entries.km) AS total_km "
-        "FROM mileage_entries "
-        "JOIN vehicles ON vehicles.id = mileage_entries.vehicle_id "
-        "WHERE mileage_entries.person_id = ? AND mileage_entries.year = ? "
-        "GROUP BY vehicles.id, vehicles.name, vehicles.power_cv"
-    )
-    with get_connection() as connection:
-        cursor = execute_query(connection, query, (person_id, year))
-        return list(cursor.fetchall())
+    params = (person_id, year, person_id, year, person_id, year)
+    with borrow_reader() as connection:
+        cursor = execute_query(connection, YEAR_BUNDLE_QUERY, params)
+        return cursor.fetchall()
 
 
 def fetch_meal_expenses_by_year(
     person_id: int,
     year: int,
-) -> list[sqlite3.Row]:
+) -> list[dict[str, Any]]:
     """Fetch meal expenses for a year.
 
     Args:
@@ -738,22 +907,22 @@ def fetch_meal_expenses_by_year(
         year: Tax year.
 
     Returns:
-        list[sqlite3.Row]: Meal expense rows.
+        list[dict[str, Any]]: Meal expense rows.
     """
 
     query = (
         "SELECT id, person_id, year, month, meal_cost "
         "FROM meal_expenses WHERE person_id = ? AND year = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (person_id, year))
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
 
 
 def fetch_other_expenses_by_year(
     person_id: int,
     year: int,
-) -> list[sqlite3.Row]:
+) -> list[dict[str, Any]]:
     """Fetch other expenses for a year.
 
     Args:
@@ -761,13 +930,85 @@ def fetch_other_expenses_by_year(
         year: Tax year.
 
     Returns:
-        list[sqlite3.Row]: Other expense rows.
+        list[dict[str, Any]]: Other expense rows.
     """
 
     query = (
         "SELECT id, person_id, year, description, amount, attachment_path "
         "FROM other_expenses WHERE person_id = ? AND year = ?"
     )
-    with get_connection() as connection:
+    with borrow_reader() as connection:
         cursor = execute_query(connection, query, (person_id, year))
-        return list(cursor.fetchall())
+        return fetch_dicts(cursor)
+
+
+def fetch_all_mileage_by_year(year: int) -> list[sqlite3.Row]:
+    """Fetch total km per person and vehicle for a year.
+
+    Args:
+        year: Tax year.
+
+    Returns:
+        list[sqlite3.Row]: Rows with person, vehicle and total_km.
+    """
+
+    query = (
+        "SELECT mileage_entries.person_id AS person_id, "
+        "vehicles.id AS vehicle_id, vehicles.name AS vehicle_name, "
+        "vehicles.power_cv AS power_cv, "
+        "SUM(mileage_entries.km) AS total_km "
+        "FROM mileage_entries "
+        "JOIN vehicles ON vehicles.id = mileage_entries.vehicle_id "
+        "WHERE mileage_entries.year = ? "
+        "GROUP BY mileage_entries.person_id, mileage_entries.vehicle_id"
+    )
+    with borrow_reader() as connection:
+        cursor = execute_query(connection, query, (year,))
+        return cursor.fetchall()
+
+
+def fetch_meal_deductions_by_year(year: int) -> list[sqlite3.Row]:
+    """Fetch the total meal deduction of every person for a year.
+
+    Totals come from the meal_deductions_total aggregate that
+    app.services registers.
+
+    Args:
+        year: Tax year.
+
+    Returns:
+        list[sqlite3.Row]: Rows with person_id and total_deduction rounded
+        to cents.
+    """
+
+    with borrow_reader() as connection:
+        cursor = execute_query(
+            connection,
+            MEAL_DEDUCTIONS_BY_YEAR_QUERY,
+            (year,),
+        )
+        return cursor.fetchall()
+
+
+def fetch_all_other_by_year(year: int) -> list[sqlite3.Row]:
+    """Fetch total other expenses per person for a year.
+
+    Totals come from the other_expenses_total aggregate that app.services
+    registers.
+
+    Args:
+        year: Tax year.
+
+    Returns:
+        list[sqlite3.Row]: Rows with person_id and total_amount rounded to
+        cents.
+    """
+
+    query = (
+        f"SELECT person_id, {OTHER_EXPENSES_SUM} AS total_amount "
+        "FROM other_expenses WHERE year = ? "
+        "GROUP BY person_id"
+    )
+    with borrow_reader() as connection:
+        cursor = execute_query(connection, query, (year,))
+        return cursor.fetchall()
@@ -2,28 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
 
 from app.constants import MAX_CV, MEAL_MAXIMUM_COST, MEAL_MINIMUM_COST
-from app.constants import MILEAGE_SCALE, MileageBracket
+from app.constants import MILEAGE_SCALE_TABLES, MileageScaleTable
+from app.db import register_aggregate
+from app.models import VehicleSummary
 from app.repositories import (
-    fetch_meal_expenses_by_year,
-    fetch_other_expenses_by_year,
-    fetch_vehicle_km_by_year,
+    fetch_all_mileage_by_year,
+    fetch_all_other_by_year,
+    fetch_meal_deductions_by_year,
+    fetch_year_bundle,
 )
 
 
-@dataclass(frozen=True)
-class VehicleDeduction:
-    """Represents a vehicle deduction result."""
-
-    vehicle_id: int
-    vehicle_name: str
-    power_cv: int
-    total_km: float
-    deduction: float
-
-
 def normalize_power_cv(power_cv: int) -> int:
     """Normalize power to the maximum scale bucket.
 
@@ -44,30 +39,64 @@ def normalize_power_cv(power_cv: int) -> int:
     return power_cv
 
 
-def select_bracket(power_cv: int, km: float) -> MileageBracket:
-    """Select the mileage bracket for the given kilometers.
+def select_bracket_index(table: MileageScaleTable, km: float) -> int:
+    """Locate the bracket of a mileage scale with a binary search.
+
+    Tables always end with an unbounded bracket, so every km value maps to
+    a valid index without further checks.
 
     Args:
-        power_cv: Fiscal power in CV.
+        table: Column-oriented mileage scale.
         km: Total kilometers.
 
     Returns:
-        MileageBracket: Matching mileage bracket.
+        int: Index of the matching bracket.
+    """
+
+    return bisect_left(table.max_km, km)
+
+
+def select_scale_table(power_cv: int) -> MileageScaleTable:
+    """Select the column-oriented mileage scale for a fiscal power.
+
+    Powers that have their own scale are looked up directly; only the
+    others go through normalize_power_cv.
+
+    Args:
+        power_cv: Fiscal power in CV.
+
+    Returns:
+        MileageScaleTable: Thresholds, rates and fixed amounts.
 
     Raises:
-        ValueError: If no bracket is defined.
+        ValueError: If no scale is defined.
     """
 
-    normalized = normalize_power_cv(power_cv)
-    brackets = MILEAGE_SCALE.get(normalized)
-    if brackets is None:
+    table = MILEAGE_SCALE_TABLES.get(power_cv)
+    if table is not None:
+        return table
+    table = MILEAGE_SCALE_TABLES.get(normalize_power_cv(power_cv))
+    if table is None:
         raise ValueError("Unsupported power scale")
-    for bracket in brackets:
-        if bracket.max_km is None:
-            return bracket
-        if km <= bracket.max_km:
-            return bracket
-    raise ValueError("No matching mileage bracket")
+    return table
+
+
+def to_cents(amount: float) -> int:
+    """Convert a monetary amount to integer cents.
+
+    Halves are rounded away from zero. Rounding applies to the binary
+    value of the amount, so a decimal half stored just below the half,
+    such as 0.145 or 1.005, rounds down.
+
+    Args:
+        amount: Amount in euros.
+
+    Returns:
+        int: Amount in cents.
+    """
+
+    cents = int(abs(amount) * 100 + 0.5)
+    return cents if amount >= 0 else -cents
 
 
 def calculate_mileage_deduction(power_cv: int, km: float) -> float:
@@ -86,8 +115,9 @@ def calculate_mileage_deduction(power_cv: int, km: float) -> float:
 
     if km < 0:
         raise ValueError("km must be non-negative")
-    bracket = select_bracket(power_cv, km)
-    return round((km * bracket.rate) + bracket.fixed, 2)
+    table = select_scale_table(power_cv)
+    index = select_bracket_index(table, km)
+    return to_cents((km * table.rates[index]) + table.fixed[index]) / 100
 
 
 def calculate_meal_deduction(meal_cost: float) -> float:
@@ -108,71 +138,213 @@ def calculate_meal_deduction(meal_cost: float) -> float:
     if meal_cost <= MEAL_MINIMUM_COST:
         return 0.0
     deductible_cost = min(meal_cost, MEAL_MAXIMUM_COST)
-    return round(deductible_cost - MEAL_MINIMUM_COST, 2)
+    return to_cents(deductible_cost - MEAL_MINIMUM_COST) / 100
+
+
+def calculate_meal_deductions(meal_costs: Sequence[float]) -> list[float]:
+    """Calculate deductions for a batch of meal expenses.
+
+    The clamp of calculate_meal_deduction is inlined so a batch costs one
+    call instead of one call per meal.
+
+    Args:
+        meal_costs: Meal costs.
+
+    Returns:
+        list[float]: Deductible amounts, in the order of meal_costs.
+
+    Raises:
+        ValueError: If a meal cost is negative.
+    """
+
+    if meal_costs and min(meal_costs) < 0:
+        raise ValueError("meal_cost must be non-negative")
+    return [
+        to_cents(min(cost, MEAL_MAXIMUM_COST) - MEAL_MINIMUM_COST) / 100
+        if cost > MEAL_MINIMUM_COST
+        else 0.0
+        for cost in meal_costs
+    ]
+
+
+def total_meal_deductions(meal_costs: Sequence[float]) -> float:
+    """Total the deductions of a batch of meal expenses.
+
+    Each deduction is rounded to cents before the sum, so the total always
+    equals the sum of the deductions listed meal by meal.
+
+    Args:
+        meal_costs: Meal costs.
+
+    Returns:
+        float: Total deductible amount.
+
+    Raises:
+        ValueError: If a meal cost is negative.
+    """
+
+    deductions = calculate_meal_deductions(meal_costs)
+    return sum([to_cents(deduction) for deduction in deductions]) / 100
+
+
+class MealDeductionsTotal:
+    """SQLite aggregate applying total_meal_deductions to a group."""
+
+    def __init__(self) -> None:
+        self.meal_costs: list[float] = []
 
+    def step(self, meal_cost: float) -> None:
+        """Collect the cost of one meal."""
 
-def build_vehicle_deductions(
+        self.meal_costs.append(meal_cost)
+
+    def finalize(self) -> float:
+        """Return the total deduction of the collected meals."""
+
+        return total_meal_deductions(self.meal_costs)
+
+
+register_aggregate("meal_deductions_total", MealDeductionsTotal)
+
+
+def total_other_expenses(amounts: Iterable[float]) -> float:
+    """Total other expenses, rounding only the sum to cents.
+
+    The sum is exact, so the total does not depend on the order of the
+    amounts or on how SQLite sums floats.
+
+    Args:
+        amounts: Other expense amounts.
+
+    Returns:
+        float: Total amount.
+    """
+
+    return to_cents(math.fsum(amounts)) / 100
+
+
+class OtherExpensesTotal:
+    """SQLite aggregate applying total_other_expenses to a group."""
+
+    def __init__(self) -> None:
+        self.amounts: list[float] = []
+
+    def step(self, amount: float) -> None:
+        """Collect the amount of one expense."""
+
+        self.amounts.append(amount)
+
+    def finalize(self) -> float:
+        """Return the total of the collected expenses."""
+
+        return total_other_expenses(self.amounts)
+
+
+register_aggregate("other_expenses_total", OtherExpensesTotal)
+
+
+def build_vehicle_deduction(row: Mapping[str, Any]) -> VehicleSummary:
+    """Build a vehicle deduction from an aggregated mileage row.
+
+    Args:
+        row: Row with vehicle_id, vehicle_name, power_cv and total_km.
+
+    Returns:
+        VehicleSummary: Vehicle deduction.
+    """
+
+    total_km = float(row["total_km"] or 0.0)
+    deduction = calculate_mileage_deduction(row["power_cv"], total_km)
+    return VehicleSummary(
+        vehicle_id=row["vehicle_id"],
+        vehicle_name=row["vehicle_name"],
+        power_cv=row["power_cv"],
+        total_km=total_km,
+        deduction=deduction,
+    )
+
+
+def build_person_year_totals(
     person_id: int,
     year: int,
-) -> list[VehicleDeduction]:
-    """Build vehicle deductions for a person and year.
+) -> tuple[list[VehicleSummary], float, float]:
+    """Build the yearly deductions of a person from a single query.
 
     Args:
         person_id: Person identifier.
         year: Tax year.
 
     Returns:
-        list[VehicleDeduction]: Vehicle deductions.
+        tuple[list[VehicleSummary], float, float]: Vehicle deductions,
+        total meal deductions and total other expenses.
     """
 
-    rows = fetch_vehicle_km_by_year(person_id, year)
-    deductions: list[VehicleDeduction] = []
+    vehicle_deductions: list[VehicleSummary] = []
+    meals_total = 0.0
+    other_total = 0.0
+    rows = fetch_year_bundle(person_id, year)
     for row in rows:
-        total_km = float(row["total_km"] or 0.0)
-        deduction = calculate_mileage_deduction(row["power_cv"], total_km)
-        deductions.append(
-            VehicleDeduction(
-                vehicle_id=row["vehicle_id"],
-                vehicle_name=row["vehicle_name"],
-                power_cv=row["power_cv"],
-                total_km=total_km,
-                deduction=deduction,
-            )
+        kind = row["kind"]
+        if kind == "mileage":
+            vehicle_deductions.append(build_vehicle_deduction(row))
+        elif kind == "meal":
+            meals_total = float(row["amount"])
+        else:
+            other_total = float(row["amount"])
+    return vehicle_deductions, meals_total, other_total
+
+
+def build_vehicle_deductions_by_person(
+    year: int,
+) -> dict[int, list[VehicleSummary]]:
+    """Build vehicle deductions for every person in a single query.
+
+    Args:
+        year: Tax year.
+
+    Returns:
+        dict[int, list[VehicleSummary]]: Vehicle deductions by person.
+    """
+
+    deductions: dict[int, list[VehicleSummary]] = {}
+    for row in fetch_all_mileage_by_year(year):
+        deductions.setdefault(row["person_id"], []).append(
+            build_vehicle_deduction(row)
         )
     return deductions
 
 
-def calculate_meals_total(person_id: int, year: int) -> float:
-    """Calculate total meal deductions for a year.
+def calculate_meals_totals_by_person(year: int) -> dict[int, float]:
+    """Calculate total meal deductions for every person in a single query.
+
+    SQLite groups the meals and total_meal_deductions totals each group,
+    so the totals match the person detail meal by meal.
 
     Args:
-        person_id: Person identifier.
         year: Tax year.
 
     Returns:
-        float: Total meal deductions.
+        dict[int, float]: Total meal deductions by person.
+
+    Raises:
+        sqlite3.OperationalError: If a stored meal cost is negative.
     """
 
-    total = 0.0
-    rows = fetch_meal_expenses_by_year(person_id, year)
-    for row in rows:
-        total += calculate_meal_deduction(float(row["meal_cost"]))
-    return round(total, 2)
+    rows = fetch_meal_deductions_by_year(year)
+    return {row["person_id"]: float(row["total_deduction"]) for row in rows}
 
 
-def calculate_other_expenses_total(person_id: int, year: int) -> float:
-    """Calculate total other expenses for a year.
+def calculate_other_expenses_totals_by_person(year: int) -> dict[int, float]:
+    """Calculate total other expenses for every person in a single query.
 
     Args:
-        person_id: Person identifier.
         year: Tax year.
 
     Returns:
-        float: Total of other expenses.
+        dict[int, float]: Total of other expenses by person.
     """
 
-    total = 0.0
-    rows = fetch_other_expenses_by_year(person_id, year)
-    for row in rows:
-        total += float(row["amount"])
-    return round(total, 2)
+    return {
+        row["person_id"]: float(row["total_amount"])
+        for row in fetch_all_other_by_year(year)
+    }
@@ -1,5 +1,7 @@
 """Tests for the FastAPI app."""
 
+import json
+import sqlite3
 from pathlib import Path
 
 from fastapi.testclient import TestClient
@@ -211,6 +213,10 @@ def test_admin_crud_and_detail_endpoints() -> None:
     assert len(detail_payload["mileage_entries"]) == 1
     assert len(detail_payload["meal_expenses"]) == 1
     assert len(detail_payload["other_expenses"]) == 1
+    assert detail_payload["mileage_deduction_total"] == 798.0
+    assert detail_payload["meals_deduction_total"] == 14.2
+    assert detail_payload["other_expenses_total"] == 300.0
+    assert detail_payload["total_deduction"] == 1112.2
 
     updated_household = client.put(
         f"/households/{household.json()['id']}",
@@ -292,3 +298,667 @@ def test_admin_crud_and_detail_endpoints() -> None:
     assert delete_vehicle.status_code == 200
     assert delete_person.status_code == 200
     assert delete_household.status_code == 200
+
+
+def test_dashboard_keeps_people_totals_separate() -> None:
+    """Role: Ensure batched dashboard totals are attributed per person.
+
+    Inputs: Seeded API data for two people sharing a household.
+    Outputs: Dashboard summary with distinct per-person totals.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Duo"})
+    first = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Alice",
+            "last_name": "Bernard",
+        },
+    )
+    second = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Bruno",
+            "last_name": "Collin",
+        },
+    )
+    vehicle = client.post(
+        "/vehicles",
+        json={
+            "person_id": first.json()["id"],
+            "name": "Citadine",
+            "power_cv": 3,
+        },
+    )
+    client.post(
+        "/mileage",
+        json={
+            "person_id": first.json()["id"],
+            "vehicle_id": vehicle.json()["id"],
+            "year": 2024,
+            "month": 1,
+            "km": 1000,
+        },
+    )
+    client.post(
+        "/other-expenses",
+        json={
+            "person_id": second.json()["id"],
+            "year": 2024,
+            "description": "Formation",
+            "amount": 250.0,
+            "attachment_path": None,
+        },
+    )
+
+    response = client.get("/api/dashboard/2024")
+
+    assert response.status_code == 200
+    people = {
+        person["first_name"]: person for person in response.json()["people"]
+    }
+    assert people["Alice"]["total_deduction"] == 529.0
+    assert people["Alice"]["other_expenses"] == 0.0
+    assert people["Bruno"]["total_deduction"] == 250.0
+    assert people["Bruno"]["vehicle_summaries"] == []
+    assert response.json()["total_deduction"] == 779.0
+
+    summary = client.get(f"/persons/{first.json()['id']}/summary/2024")
+
+    assert summary.status_code == 200
+    assert summary.json()["total_deduction"] == 529.0
+    assert summary.json()["vehicle_summaries"][0]["total_km"] == 1000.0
+
+
+def test_list_vehicles_includes_owner_name() -> None:
+    """Role: Ensure the vehicle list exposes the owner full name.
+
+    Inputs: Seeded API data for one vehicle.
+    Outputs: Vehicle list response with person_name.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Gamma"})
+    person = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Chloé",
+            "last_name": "Roux",
+        },
+    )
+    client.post(
+        "/vehicles",
+        json={
+            "person_id": person.json()["id"],
+            "name": "Utilitaire",
+            "power_cv": 5,
+        },
+    )
+
+    response = client.get("/vehicles")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": 1,
+            "person_id": person.json()["id"],
+            "person_name": "Chloé Roux",
+            "name": "Utilitaire",
+            "power_cv": 5,
+        }
+    ]
+
+
+def test_dashboard_rejects_out_of_range_year() -> None:
+    """Role: Ensure years outside the supported range are rejected.
+
+    Inputs: Dashboard request for a year before 2000.
+    Outputs: Validation error response.
+    Errors: None.
+    """
+
+    client = TestClient(app)
+    response = client.get("/api/dashboard/1999")
+
+    assert response.status_code == 422
+
+
+def test_list_households_streams_json_array() -> None:
+    """Role: Ensure streamed list endpoints return valid JSON arrays.
+
+    Inputs: Empty database, then one household.
+    Outputs: Empty array, then a one-element array.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+
+    assert client.get("/households").json() == []
+
+    household = client.post("/households", json={"name": "Foyer Delta"})
+    response = client.get("/households")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [household.json()]
+
+
+def test_person_summary_refreshes_after_write() -> None:
+    """Role: Ensure cached person summaries are invalidated by writes.
+
+    Inputs: Person summary requested before and after a new meal.
+    Outputs: Summary totals reflecting the new meal.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Epsilon"})
+    person = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Denis",
+            "last_name": "Faure",
+        },
+    )
+    summary_url = f"/persons/{person.json()['id']}/summary/2024"
+
+    assert client.get(summary_url).json()["total_deduction"] == 0.0
+
+    client.post(
+        "/meals",
+        json={
+            "person_id": person.json()["id"],
+            "year": 2024,
+            "month": 6,
+            "meal_cost": 15.2,
+        },
+    )
+
+    assert client.get(summary_url).json()["total_deduction"] == 10.0
+
+
+def test_dashboard_etag_short_circuits_until_write() -> None:
+    """Role: Ensure the dashboard answers 304 until the data changes.
+
+    Inputs: Dashboard requested with and without a matching ETag.
+    Outputs: 304 for an unchanged dashboard, 200 after a new meal.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Zeta"})
+    person = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Emma",
+            "last_name": "Garnier",
+        },
+    )
+
+    first = client.get("/api/dashboard/2024")
+    etag = first.headers["etag"]
+    cached = client.get("/api/dashboard/2024", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert cached.status_code == 304
+
+    client.post(
+        "/meals",
+        json={
+            "person_id": person.json()["id"],
+            "year": 2024,
+            "month": 6,
+            "meal_cost": 15.2,
+        },
+    )
+    refreshed = client.get(
+        "/api/dashboard/2024", headers={"If-None-Match": etag}
+    )
+
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert refreshed.json()["total_deduction"] == 10.0
+
+
+def test_dashboard_refreshes_after_external_write() -> None:
+    """Role: Ensure writes from another connection invalidate the caches.
+
+    Inputs: Dashboard requested before and after a meal inserted through
+    a separate SQLite connection, as another worker would.
+    Outputs: 200 with a new ETag instead of 304.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Mu"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Noe",
+            "last_name": "Roux",
+        },
+    ).json()["id"]
+    etag = client.get("/api/dashboard/2024").headers["etag"]
+
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute(
+            "INSERT INTO meal_expenses (person_id, year, month, meal_cost) "
+            "VALUES (?, 2024, 6, 15.2)",
+            (person_id,),
+        )
+    connection.close()
+    refreshed = client.get(
+        "/api/dashboard/2024", headers={"If-None-Match": etag}
+    )
+
+    assert refreshed.status_code == 200
+    assert refreshed.json()["total_deduction"] == 10.0
+
+
+def test_dashboard_stream_yields_one_line_per_person() -> None:
+    """Role: Ensure the dashboard stream matches the dashboard people.
+
+    Inputs: Two persons, one with a meal expense.
+    Outputs: NDJSON lines equal to the dashboard people.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Eta"})
+    for first_name in ("Fanny", "Gilles"):
+        person = client.post(
+            "/persons",
+            json={
+                "household_id": household.json()["id"],
+                "first_name": first_name,
+                "last_name": "Henry",
+            },
+        )
+    client.post(
+        "/meals",
+        json={
+            "person_id": person.json()["id"],
+            "year": 2024,
+            "month": 6,
+            "meal_cost": 15.2,
+        },
+    )
+
+    response = client.get("/api/dashboard/2024/stream")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert lines == client.get("/api/dashboard/2024").json()["people"]
+
+
+def test_bulk_create_endpoints_feed_summary() -> None:
+    """Role: Ensure bulk-created expenses are stored and summarized.
+
+    Inputs: Bulk mileage, meal and other expense payloads.
+    Outputs: Created counts and the matching person summary.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Theta"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Ines",
+            "last_name": "Jacob",
+        },
+    ).json()["id"]
+    vehicle_id = client.post(
+        "/vehicles",
+        json={"person_id": person_id, "name": "Clio", "power_cv": 3},
+    ).json()["id"]
+
+    mileage = client.post(
+        "/mileage/bulk",
+        json=[
+            {
+                "person_id": person_id,
+                "vehicle_id": vehicle_id,
+                "year": 2024,
+                "month": month,
+                "km": 500,
+            }
+            for month in (1, 2)
+        ],
+    )
+    meals = client.post(
+        "/meals/bulk",
+        json=[
+            {"person_id": person_id, "year": 2024, "month": 3,
+             "meal_cost": 15.2},
+            {"person_id": person_id, "year": 2024, "month": 4,
+             "meal_cost": 15.2},
+        ],
+    )
+    other = client.post(
+        "/other-expenses/bulk",
+        json=[
+            {"person_id": person_id, "year": 2024,
+             "description": "Livres", "amount": 40.0},
+        ],
+    )
+    summary = client.get(f"/persons/{person_id}/summary/2024").json()
+
+    assert mileage.json() == {"created": 2}
+    assert meals.json() == {"created": 2}
+    assert other.json() == {"created": 1}
+    assert summary["vehicle_summaries"][0]["total_km"] == 1000.0
+    assert summary["meals_deduction"] == 20.0
+    assert summary["other_expenses"] == 40.0
+
+
+def test_failed_bulk_create_writes_nothing() -> None:
+    """Role: Ensure a bulk insert failing outside SQLite is rolled back.
+
+    Inputs: Fifty valid meals followed by one with an oversized person_id,
+    then an unrelated write.
+    Outputs: 500 for the bulk insert and no meal stored afterwards.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app, raise_server_exceptions=False)
+    household = client.post("/households", json={"name": "Foyer Kappa"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Lou",
+            "last_name": "Petit",
+        },
+    ).json()["id"]
+    meals = [
+        {"person_id": person_id, "year": 2024, "month": 1,
+         "meal_cost": 15.2}
+        for _ in range(50)
+    ]
+    meals.append(
+        {"person_id": 2**70, "year": 2024, "month": 1, "meal_cost": 15.2}
+    )
+
+    response = client.post("/meals/bulk", json=meals)
+    client.post("/households", json={"name": "Foyer Lambda"})
+    detail = client.get(f"/api/people/{person_id}/details/2024").json()
+
+    assert response.status_code == 500
+    assert detail["meal_expenses"] == []
+
+
+def test_person_summary_not_found_after_delete() -> None:
+    """Role: Ensure cached person lookups are invalidated by deletes.
+
+    Inputs: Person summary requested before and after deleting the person.
+    Outputs: 200 then 404.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Iota"})
+    person = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Jules",
+            "last_name": "Klein",
+        },
+    )
+    summary_url = f"/persons/{person.json()['id']}/summary/2024"
+
+    assert client.get(summary_url).status_code == 200
+
+    client.delete(f"/persons/{person.json()['id']}")
+
+    assert client.get(summary_url).status_code == 404
+
+
+def test_meal_totals_agree_for_sub_cent_deductions() -> None:
+    """Role: Ensure every endpoint rounds meal deductions the same way.
+
+    Inputs: Three meals whose deductions are below half a cent over a cent.
+    Outputs: Identical meal totals in summary, detail and dashboard.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Kappa"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Karim",
+            "last_name": "Laurent",
+        },
+    ).json()["id"]
+    for month in (1, 2, 3):
+        client.post(
+            "/meals",
+            json={
+                "person_id": person_id,
+                "year": 2024,
+                "month": month,
+                "meal_cost": 5.214,
+            },
+        )
+
+    summary = client.get(f"/persons/{person_id}/summary/2024").json()
+    detail = client.get(f"/api/people/{person_id}/details/2024").json()
+    dashboard = client.get("/api/dashboard/2024").json()
+
+    assert summary["meals_deduction"] == 0.03
+    assert detail["meals_deduction_total"] == 0.03
+    assert dashboard["people"][0]["meals_deduction"] == 0.03
+
+
+def test_meal_totals_agree_on_binary_halves() -> None:
+    """Role: Ensure a half-cent meal deduction rounds alike everywhere.
+
+    Inputs: One meal whose deduction is a decimal half cent that is
+    stored just below the half.
+    Outputs: The meal row deduction equal to the summary, detail and
+    dashboard meal totals.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Nu"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Alix",
+            "last_name": "Moreau",
+        },
+    ).json()["id"]
+    client.post(
+        "/meals",
+        json={
+            "person_id": person_id,
+            "year": 2024,
+            "month": 1,
+            "meal_cost": 5.495,
+        },
+    )
+
+    summary = client.get(f"/persons/{person_id}/summary/2024").json()
+    detail = client.get(f"/api/people/{person_id}/details/2024").json()
+    dashboard = client.get("/api/dashboard/2024").json()
+
+    assert detail["meal_expenses"][0]["deductible_amount"] == 0.29
+    assert detail["meals_deduction_total"] == 0.29
+    assert summary["meals_deduction"] == 0.29
+    assert dashboard["people"][0]["meals_deduction"] == 0.29
+
+
+def test_other_expense_totals_agree_for_sub_cent_amounts() -> None:
+    """Role: Ensure every endpoint sums other expenses before rounding.
+
+    Inputs: Three other expenses of less than half a cent each.
+    Outputs: Identical other expense totals in summary, detail and
+    dashboard.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Lambda"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Lina",
+            "last_name": "Martin",
+        },
+    ).json()["id"]
+    for _ in range(3):
+        client.post(
+            "/other-expenses",
+            json={
+                "person_id": person_id,
+                "year": 2024,
+                "description": "Timbre",
+                "amount": 0.004,
+            },
+        )
+
+    summary = client.get(f"/persons/{person_id}/summary/2024").json()
+    detail = client.get(f"/api/people/{person_id}/details/2024").json()
+    dashboard = client.get("/api/dashboard/2024").json()
+
+    assert summary["other_expenses"] == 0.01
+    assert detail["other_expenses_total"] == 0.01
+    assert dashboard["people"][0]["other_expenses"] == 0.01
+
+
+def test_totals_agree_when_float_sums_round_differently() -> None:
+    """Role: Ensure summary, detail and dashboard share one set of totals.
+
+    Inputs: Two other expenses whose float sum lies just below a half cent.
+    Outputs: Identical other expense and overall totals on every endpoint.
+    Errors: None.
+    """
+
+    db_path = Path("data.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    init_db()
+    client = TestClient(app)
+    household = client.post("/households", json={"name": "Foyer Xi"})
+    person_id = client.post(
+        "/persons",
+        json={
+            "household_id": household.json()["id"],
+            "first_name": "Sacha",
+            "last_name": "Bernard",
+        },
+    ).json()["id"]
+    client.post(
+        "/meals",
+        json={
+            "person_id": person_id,
+            "year": 2024,
+            "month": 1,
+            "meal_cost": 5.82,
+        },
+    )
+    for amount in (68.705, 11.85):
+        client.post(
+            "/other-expenses",
+            json={
+                "person_id": person_id,
+                "year": 2024,
+                "description": "Fournitures",
+                "amount": amount,
+            },
+        )
+
+    summary = client.get(f"/persons/{person_id}/summary/2024").json()
+    detail = client.get(f"/api/people/{person_id}/details/2024").json()
+    person = client.get("/api/dashboard/2024").json()["people"][0]
+
+    assert summary["other_expenses"] == 80.55
+    assert detail["other_expenses_total"] == 80.55
+    assert person["other_expenses"] == 80.55
+    assert summary["total_deduction"] == 81.17
+    assert detail["total_deduction"] == 81.17
+    assert person["total_deduction"] == 81.17
@@ -1,9 +1,14 @@
 """Tests for deduction calculations."""
 
+import pytest
+
 from app.constants import MEAL_MAXIMUM_COST, MEAL_MINIMUM_COST
+from app.constants import MileageBracket, build_scale_table
 from app.services import (
     calculate_meal_deduction,
+    calculate_meal_deductions,
     calculate_mileage_deduction,
+    to_cents,
 )
 
 
@@ -33,3 +38,46 @@ def test_calculate_meal_deduction_cap() -> None:
 
     result = calculate_meal_deduction(MEAL_MAXIMUM_COST + 5)
     assert result == round(MEAL_MAXIMUM_COST - MEAL_MINIMUM_COST, 2)
+
+
+def test_calculate_mileage_deduction_bracket_boundary() -> None:
+    """Bracket limits should be inclusive of their maximum km."""
+
+    assert calculate_mileage_deduction(3, 5000) == 2645.0
+    assert calculate_mileage_deduction(3, 5001) == round(
+        5001 * 0.316 + 1065.0, 2
+    )
+
+
+def test_build_scale_table_requires_open_last_bracket() -> None:
+    """Scale tables should reject a bounded last bracket."""
+
+    with pytest.raises(ValueError):
+        build_scale_table([MileageBracket(max_km=5000, rate=0.5, fixed=0.0)])
+
+
+def test_calculate_meal_deductions_matches_single_meal() -> None:
+    """Batch meal deductions should match the per-meal calculation."""
+
+    costs = [0.0, MEAL_MINIMUM_COST, 12.35, MEAL_MAXIMUM_COST, 40.0]
+
+    assert calculate_meal_deductions(costs) == [
+        calculate_meal_deduction(cost) for cost in costs
+    ]
+
+
+def test_to_cents_rounds_halves_away_from_zero() -> None:
+    """Ensure cent conversion is symmetric around zero."""
+
+    assert to_cents(0.125) == 13
+    assert to_cents(-0.125) == -13
+    assert to_cents(-2.5) == -250
+
+
+def test_to_cents_rounds_binary_value_of_decimal_halves() -> None:
+    """Halves stored just below their decimal value should round down."""
+
+    assert to_cents(0.145) == 14
+    assert to_cents(-0.145) == -14
+    assert to_cents(1.005) == 100
+    assert to_cents(0.155) == 16